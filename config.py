@@ -9,7 +9,7 @@ from dataclasses import dataclass
 from typing import Dict, Any
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RevenueConfig:
     """Configuration for revenue model parameters."""
     
@@ -45,7 +45,7 @@ class RevenueConfig:
     monthly_churn_sigma: float = 1.0
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CostConfig:
     """Configuration for cost model parameters."""
     
@@ -95,7 +95,7 @@ class CostConfig:
     compute_per_sim_year_max: float = 25.0
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SimulationConfig:
     """Configuration for simulation parameters."""
     
@@ -113,58 +113,71 @@ class SimulationConfig:
     
     # Small value to prevent log(0)
     epsilon: float = 1e-9
+    
+    # Parameter sets kept in the simulation cache
+    cache_max_entries: int = 8
 
 
-# Create global configuration instances
-REVENUE_CONFIG = RevenueConfig()
-COST_CONFIG = CostConfig()
-SIMULATION_CONFIG = SimulationConfig()
-
-# Chart styling configuration - Semantic colors aligned with data meaning
-# Professional financial dashboard palette with semantic color associations
-CHART_COLORS = {
+@dataclass(frozen=True, slots=True)
+class ChartColors:
+    """Semantic chart palette, read by attribute (e.g. CHART_COLORS.revenue)."""
+    
     # Core semantic colors - aligned with financial meaning
-    'primary': '#3B82F6',        # Blue - general primary data
-    'secondary': '#6B7280',      # Gray - supporting elements
-    'success': '#10B981',        # Green - positive metrics
-    'warning': '#F59E0B',        # Amber - caution/warnings
-    'danger': '#EF4444',         # Red - alerts/negative metrics
-    'info': '#8B5CF6',           # Purple - informational content
+    primary: str = '#3B82F6'            # Blue - general primary data
+    secondary: str = '#6B7280'          # Gray - supporting elements
+    success: str = '#10B981'            # Green - positive metrics
+    warning: str = '#F59E0B'            # Amber - caution/warnings
+    danger: str = '#EF4444'             # Red - alerts/negative metrics
+    info: str = '#8B5CF6'               # Purple - informational content
     
     # Revenue colors - GREEN spectrum (positive financial flow)
-    'revenue': '#10B981',        # Green - total revenue (primary)
-    'revenue_secondary': '#059669',   # Dark green - subscription revenue
-    'revenue_tertiary': '#34D399',    # Light green - usage revenue
+    revenue: str = '#10B981'            # Green - total revenue (primary)
+    revenue_secondary: str = '#059669'  # Dark green - subscription revenue
+    revenue_tertiary: str = '#34D399'   # Light green - usage revenue
     
     # Cost colors - RED spectrum (negative financial flow)
-    'cost': '#EF4444',           # Red - total costs (primary)
-    'cost_secondary': '#DC2626',  # Dark red - fixed costs
-    'cost_tertiary': '#F87171',   # Light red - variable costs
+    cost: str = '#EF4444'               # Red - total costs (primary)
+    cost_secondary: str = '#DC2626'     # Dark red - fixed costs
+    cost_tertiary: str = '#F87171'      # Light red - variable costs
     
     # Specific cost types - RED variations
-    'hosting': '#EF4444',        # Red - hosting costs
-    'software': '#DC2626',       # Dark red - software costs  
-    'compute': '#F87171',        # Light red - compute costs
-    'support': '#FCA5A5',        # Very light red - support costs
-    'admin': '#B91C1C',          # Very dark red - admin costs
-    'conference': '#7F1D1D',     # Darkest red - conference costs
+    hosting: str = '#EF4444'            # Red - hosting costs
+    software: str = '#DC2626'           # Dark red - software costs  
+    compute: str = '#F87171'            # Light red - compute costs
+    support: str = '#FCA5A5'            # Very light red - support costs
+    admin: str = '#B91C1C'              # Very dark red - admin costs
+    conference: str = '#7F1D1D'         # Darkest red - conference costs
     
     # People/Headcount - PURPLE spectrum
-    'headcount': '#8B5CF6',      # Purple - headcount/team metrics
-    'salary': '#7C3AED',         # Dark purple - salary costs
+    headcount: str = '#8B5CF6'          # Purple - headcount/team metrics
+    salary: str = '#7C3AED'             # Dark purple - salary costs
     
     # Performance metrics - BLUE spectrum
-    'earnings': '#3B82F6',       # Blue - profitability
-    'efficiency': '#06B6D4',     # Cyan - productivity metrics
+    earnings: str = '#3B82F6'           # Blue - profitability
+    efficiency: str = '#06B6D4'         # Cyan - productivity metrics
     
     # Customer metrics - TEAL/CYAN spectrum  
-    'customers': '#14B8A6',      # Teal - customer count
-    'churn': '#F59E0B'           # Amber - churn (warning)
-}
-
-CHART_STYLE = {
-    'median_width': 4,           # Thicker median line for visibility
-    'percentile_width': 2,       # Standard percentile width
-    'percentile_dash': 'dash',   # Dashed lines for percentiles
-    'opacity_background': 0.15   # Slightly more opacity for dark theme
-} 
\ No newline at end of file
+    customers: str = '#14B8A6'          # Teal - customer count
+    churn: str = '#F59E0B'              # Amber - churn (warning)
+
+
+@dataclass(frozen=True, slots=True)
+class ChartStyle:
+    """Line styling for percentile charts, read by attribute (e.g. CHART_STYLE.median_width)."""
+    
+    median_width: float = 4             # Thicker median line for visibility
+    percentile_width: float = 2         # Standard percentile width
+    percentile_dash: str = 'dash'       # Dashed lines for percentiles
+    opacity_background: float = 0.15    # Slightly more opacity for dark theme
+
+
+# Create global configuration instances (immutable; use dataclasses.replace for variants)
+REVENUE_CONFIG = RevenueConfig()
+COST_CONFIG = CostConfig()
+SIMULATION_CONFIG = SimulationConfig()
+
+# Chart styling configuration - Semantic colors aligned with data meaning
+# Professional financial dashboard palette with semantic color associations
+CHART_COLORS = ChartColors()
+
+CHART_STYLE = ChartStyle()
@@ -6,12 +6,19 @@ separated from the UI and simulation orchestration.
 """
 
 import numpy as np
-from typing import List, Tuple, Dict, NamedTuple
+from typing import Tuple, NamedTuple, Optional
 from dataclasses import dataclass
 
 from config import REVENUE_CONFIG, COST_CONFIG, SIMULATION_CONFIG
 
 
+# Storage dtypes for simulation outputs. Results are displayed in whole
+# dollars and people, so single precision halves the memory moved by every
+# downstream reduction without any visible change.
+VALUE_DTYPE = np.float32
+COUNT_DTYPE = np.int32
+
+
 class RevenueParameters(NamedTuple):
     """Parameters for revenue model simulation."""
     seat_fee: float
@@ -48,238 +55,301 @@ class CostParameters(NamedTuple):
     compute_per_sim_year: float
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SimulationResults:
-    """Results from a single simulation run."""
+    """
+    Results from all simulation runs.
+    
+    Monthly series are (num_simulations, months) arrays; per-simulation
+    summaries are (num_simulations,) arrays.
+    """
     # Revenue streams
-    total_revenue: List[float]
-    seat_revenue: List[float]
-    simulation_revenue: List[float]
+    total_revenue: np.ndarray
+    seat_revenue: np.ndarray
+    simulation_revenue: np.ndarray
     
     # Customer metrics
-    customers: List[int]
-    churn: List[int]
+    customers: np.ndarray
+    churn: np.ndarray
     
     # Cost components
-    total_costs: List[float]
-    fixed_costs: List[float]
-    variable_costs: List[float]
-    salary_costs: List[float]
-    hosting_costs: List[float]
-    software_costs: List[float]
-    admin_costs: List[float]
-    conference_costs: List[float]
-    compute_costs: List[float]
-    customer_support_costs: List[float]
+    total_costs: np.ndarray
+    fixed_costs: np.ndarray
+    variable_costs: np.ndarray
+    salary_costs: np.ndarray
+    hosting_costs: np.ndarray
+    software_costs: np.ndarray
+    admin_costs: np.ndarray
+    conference_costs: np.ndarray
+    compute_costs: np.ndarray
+    customer_support_costs: np.ndarray
     
     # Headcount
-    headcount: List[int]
+    headcount: np.ndarray
+    
+    # Earnings
+    earnings: np.ndarray
+    cumulative_earnings: np.ndarray
+    min_cumulative_earnings: np.ndarray
+    profitable_months: np.ndarray
 
 
 class RevenueModel:
     """Revenue calculation model using Monte Carlo simulation."""
     
-    def __init__(self, params: RevenueParameters):
+    def __init__(self, params: RevenueParameters, rng: Optional[np.random.Generator] = None):
         """
         Initialize revenue model with parameters.
         
         Args:
             params: Revenue model parameters
+            rng: Random generator (defaults to a freshly seeded one)
         """
         self.params = params
+        self.rng = rng if rng is not None else np.random.default_rng()
     
-    def simulate_single_run(self, months: int) -> Tuple[List[float], List[float], List[float], List[int], List[int], List[float]]:
+    def simulate_batch(self, months: int, num_simulations: int) -> Tuple[
+        np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray
+    ]:
         """
-        Run a single revenue simulation.
+        Run all revenue simulations at once, vectorized across simulations.
+        
+        Every random variate that does not depend on the customer count is
+        drawn up front as a (num_simulations, months) matrix; only churn, which
+        depends on the running count, is drawn month by month.
         
         Args:
             months: Number of months to simulate
+            num_simulations: Number of Monte Carlo simulations
             
         Returns:
-            Tuple of (total_revenue, seat_revenue, simulation_revenue, customers, churn, simulation_years)
+            Tuple of (total_revenue, seat_revenue, simulation_revenue, customers,
+            churn, simulation_years), each of shape (num_simulations, months);
+            values are VALUE_DTYPE and counts COUNT_DTYPE
         """
-        revenue, seat_revenue, simulation_revenue = [], [], []
-        customers, churn_total = [], []
-        simulation_years_total = []
+        shape = (num_simulations, months)
+        eps = SIMULATION_CONFIG.epsilon
         
-        customer_count = 0
-        customer_growth = self.params.customer_growth_median
+        # Median adds compound monthly, so the whole schedule is closed-form
+        growth_schedule = (
+            self.params.customer_growth_median * 
+            (1 + self.params.customer_growth_accel) ** np.arange(months)
+        )
+        
+        # Customer acquisition (nothing before the delay)
+        new_customers = self.rng.lognormal(
+            mean=np.log(growth_schedule + eps), 
+            sigma=self.params.customer_growth_sigma,
+            size=shape
+        ).astype(np.int64)
+        new_customers[:, :self.params.customer_delay] = 0
+        
+        # Customer churn rates, capped at 50% in place
+        churn_rates = self.rng.lognormal(
+            mean=np.log(self.params.monthly_churn_median + eps), 
+            sigma=self.params.monthly_churn_sigma,
+            size=shape
+        )
+        np.minimum(churn_rates, 0.5, out=churn_rates)
+        
+        customers = np.empty(shape, dtype=COUNT_DTYPE)
+        churn_total = np.empty(shape, dtype=COUNT_DTYPE)
+        customer_count = np.zeros(num_simulations, dtype=np.int64)
         
         for month in range(months):
-            # Customer acquisition
-            if month >= self.params.customer_delay:
-                new_customers = int(np.random.lognormal(
-                    mean=np.log(customer_growth + SIMULATION_CONFIG.epsilon), 
-                    sigma=self.params.customer_growth_sigma
-                ))
-            else:
-                new_customers = 0
-            
-            customer_count += new_customers
-            
-            # Customer churn
-            churn_rate = np.random.lognormal(
-                mean=np.log(self.params.monthly_churn_median + SIMULATION_CONFIG.epsilon), 
-                sigma=self.params.monthly_churn_sigma
-            )
-            churn_rate = min(churn_rate, 0.5)  # Cap churn at 50%
-            month_churn = int(np.random.binomial(customer_count, churn_rate))
-            customer_count = max(0, customer_count - month_churn)
-            
-            # Update growth rate
-            customer_growth *= (1 + self.params.customer_growth_accel)
+            customer_count += new_customers[:, month]
+            # A binomial draw never exceeds its count, so this stays non-negative
+            month_churn = self.rng.binomial(customer_count, churn_rates[:, month])
+            customer_count -= month_churn
             
-            # Calculate revenue streams
-            monthly_seat_revenue = customer_count * self.params.avg_seats * self.params.seat_fee
-            
-            # Simulation-year revenue (random per customer)
-            if customer_count > 0:
-                sim_years_total = 0
-                for _ in range(customer_count):
-                    customer_sim_years = np.random.lognormal(
-                        mean=np.log(self.params.sim_year_revenue_mean + SIMULATION_CONFIG.epsilon),
-                        sigma=self.params.sim_year_revenue_sigma
-                    )
-                    sim_years_total += customer_sim_years
-                
-                monthly_simulation_revenue = sim_years_total * self.params.revenue_per_sim_year
-            else:
-                sim_years_total = 0
-                monthly_simulation_revenue = 0
-            
-            # Total revenue
-            total_monthly_revenue = monthly_seat_revenue + monthly_simulation_revenue
+            customers[:, month] = customer_count
+            churn_total[:, month] = month_churn
+        
+        # Calculate revenue streams
+        seat_revenue = customers * (self.params.avg_seats * self.params.seat_fee)
+        
+        # Simulation-year revenue (random per customer)
+        simulation_years = self._draw_simulation_years(customers)
+        simulation_revenue = simulation_years * self.params.revenue_per_sim_year
+        
+        return (
+            (seat_revenue + simulation_revenue).astype(VALUE_DTYPE),
+            seat_revenue.astype(VALUE_DTYPE),
+            simulation_revenue.astype(VALUE_DTYPE),
+            customers,
+            churn_total,
+            simulation_years.astype(VALUE_DTYPE)
+        )
+    
+    def _draw_simulation_years(self, customers: np.ndarray) -> np.ndarray:
+        """
+        Draw one lognormal usage value per customer and total them per cell.
+        
+        All customer-months are drawn in a single call and summed back into
+        their (simulation, month) cell with np.add.reduceat.
+        
+        Args:
+            customers: Active customer counts, any shape
             
-            # Store results
-            revenue.append(total_monthly_revenue)
-            seat_revenue.append(monthly_seat_revenue)
-            simulation_revenue.append(monthly_simulation_revenue)
-            customers.append(customer_count)
-            churn_total.append(month_churn)
-            simulation_years_total.append(sim_years_total)
-        
-        return revenue, seat_revenue, simulation_revenue, customers, churn_total, simulation_years_total
+        Returns:
+            Total simulation-years with the same shape as customers
+        """
+        counts = customers.ravel()
+        total_customers = int(counts.sum())
+        if total_customers == 0:
+            return np.zeros(customers.shape)
+        
+        customer_sim_years = self.rng.lognormal(
+            mean=np.log(self.params.sim_year_revenue_mean + SIMULATION_CONFIG.epsilon),
+            sigma=self.params.sim_year_revenue_sigma,
+            size=total_customers
+        )
+        
+        # reduceat needs in-range starts; empty cells are zeroed afterwards
+        starts = np.minimum(np.cumsum(counts) - counts, total_customers - 1)
+        totals = np.where(counts > 0, np.add.reduceat(customer_sim_years, starts), 0.0)
+        return totals.reshape(customers.shape)
 
 
 class CostModel:
     """Cost calculation model using Monte Carlo simulation."""
     
-    def __init__(self, params: CostParameters):
+    def __init__(self, params: CostParameters, rng: Optional[np.random.Generator] = None):
         """
         Initialize cost model with parameters.
         
         Args:
             params: Cost model parameters
+            rng: Random generator (defaults to a freshly seeded one)
         """
         self.params = params
+        self.rng = rng if rng is not None else np.random.default_rng()
     
-    def simulate_single_run(self, months: int, customers: List[int], simulation_years: List[float]) -> Tuple[
-        List[float], List[float], List[float], List[float], List[float],
-        List[float], List[float], List[float], List[float], List[float],
-        List[int]
+    def simulate_batch(self, months: int, customers: np.ndarray, simulation_years: np.ndarray) -> Tuple[
+        np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray,
+        np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray,
+        np.ndarray
     ]:
         """
-        Run a single cost simulation.
+        Run all cost simulations at once, vectorized across simulations.
         
         Args:
             months: Number of months to simulate
-            customers: Customer count for each month
-            simulation_years: Total simulation-years for each month
+            customers: Customer counts of shape (num_simulations, months)
+            simulation_years: Total simulation-years of shape (num_simulations, months)
             
         Returns:
-            Tuple of cost components and headcount
+            Tuple of cost components (VALUE_DTYPE) and headcount (COUNT_DTYPE),
+            each of shape (num_simulations, months)
         """
-        total_costs, fixed_costs, variable_costs = [], [], []
-        salary_costs, hosting_costs, software_costs = [], [], []
-        admin_costs, conference_costs = [], []
-        compute_costs, customer_support_costs = [], []
-        headcount_results = []
+        num_simulations = customers.shape[0]
+        shape = (num_simulations, months)
+        headcount_results = np.empty(shape, dtype=COUNT_DTYPE)
+        
+        eps = SIMULATION_CONFIG.epsilon
         
-        headcount = self.params.initial_headcount
-        headcount_growth = self.params.headcount_growth_median
+        # Median adds compound monthly, so the whole schedule is closed-form
+        growth_schedule = (
+            self.params.headcount_growth_median * 
+            (1 + self.params.headcount_growth_accel) ** np.arange(months)
+        )
+        
+        # Draw the noise once and build both candidate adds for every month:
+        # the normal rate and the slowed rate applied to larger teams
+        headcount_noise = self.params.headcount_growth_sigma * self.rng.standard_normal(shape)
+        normal_adds = np.exp(np.log(growth_schedule + eps) + headcount_noise).astype(np.int64)
+        slowed_adds = np.exp(
+            np.log(growth_schedule * COST_CONFIG.headcount_slowdown_factor + eps) + headcount_noise
+        ).astype(np.int64)
+        
+        headcount = np.full(num_simulations, self.params.initial_headcount, dtype=np.int64)
         
         for month in range(months):
             # Headcount growth simulation
             if month >= self.params.headcount_delay:
                 # Apply slowdown for larger teams
-                if headcount >= COST_CONFIG.headcount_slowdown_threshold:
-                    adjusted_growth = headcount_growth * COST_CONFIG.headcount_slowdown_factor
-                else:
-                    adjusted_growth = headcount_growth
-                
-                new_headcount = int(np.random.lognormal(
-                    mean=np.log(adjusted_growth + SIMULATION_CONFIG.epsilon),
-                    sigma=self.params.headcount_growth_sigma
-                ))
-            else:
-                new_headcount = 0
-            
-            headcount += new_headcount
-            headcount_growth *= (1 + self.params.headcount_growth_accel)
+                headcount += np.where(
+                    headcount >= COST_CONFIG.headcount_slowdown_threshold,
+                    slowed_adds[:, month],
+                    normal_adds[:, month]
+                )
             
-            # Calculate individual cost components
-            year_factor = month // 12  # Annual growth factor
-            
-            hosting_cost = self.params.hosting_initial * (1 + self.params.hosting_growth) ** year_factor
-            software_cost = self.params.software_initial * (1 + self.params.software_growth) ** year_factor
-            admin_cost = self.params.admin_monthly
-            conference_cost = self.params.conference_monthly
-            salary_cost = headcount * self.params.salary_per_person
-            
-            # Variable costs
-            # Compute cost now depends on simulation-years
-            base_compute_cost = self.params.compute_initial * (1 + self.params.compute_growth) ** year_factor
-            sim_year_compute_cost = simulation_years[month] * self.params.compute_per_sim_year
-            compute_cost = base_compute_cost + sim_year_compute_cost
-            customer_support_cost = (
-                self.params.support_customer_initial * 
-                (1 + self.params.support_growth) ** year_factor * 
-                customers[month]
-            )
-            
-            # Aggregate costs
-            fixed_cost = (
-                hosting_cost + software_cost + admin_cost + 
-                conference_cost + salary_cost
-            )
-            variable_cost = compute_cost + customer_support_cost
-            total_cost = fixed_cost + variable_cost
-            
-            # Store results
-            total_costs.append(total_cost)
-            fixed_costs.append(fixed_cost)
-            variable_costs.append(variable_cost)
-            salary_costs.append(salary_cost)
-            hosting_costs.append(hosting_cost)
-            software_costs.append(software_cost)
-            admin_costs.append(admin_cost)
-            conference_costs.append(conference_cost)
-            compute_costs.append(compute_cost)
-            customer_support_costs.append(customer_support_cost)
-            headcount_results.append(headcount)
+            headcount_results[:, month] = headcount
+        
+        # Annual growth multipliers: one power per year, expanded to months by indexing
+        year_factor = np.arange(months) // 12
+        years = np.arange(months // 12 + 1)
+        hosting_cost = self.params.hosting_initial * ((1 + self.params.hosting_growth) ** years)[year_factor]
+        software_cost = self.params.software_initial * ((1 + self.params.software_growth) ** years)[year_factor]
+        base_compute_cost = self.params.compute_initial * ((1 + self.params.compute_growth) ** years)[year_factor]
+        support_per_customer = self.params.support_customer_initial * ((1 + self.params.support_growth) ** years)[year_factor]
+        admin_cost = np.full(months, self.params.admin_monthly)
+        conference_cost = np.full(months, self.params.conference_monthly)
+        
+        # Calculate individual cost components for every month at once
+        salary_cost = headcount_results * self.params.salary_per_person
+        
+        # Variable costs
+        # Compute cost now depends on simulation-years
+        compute_cost = base_compute_cost + simulation_years * self.params.compute_per_sim_year
+        customer_support_cost = support_per_customer * customers
         
+        # Aggregate costs
+        fixed_cost = (
+            hosting_cost + software_cost + admin_cost + 
+            conference_cost + salary_cost
+        )
+        variable_cost = compute_cost + customer_support_cost
+        
+        total_cost = fixed_cost + variable_cost
         return (
-            total_costs, fixed_costs, variable_costs, salary_costs,
-            hosting_costs, software_costs, admin_costs, conference_costs,
-            compute_costs, customer_support_costs, headcount_results
+            *(
+                self._per_simulation(cost, shape) for cost in (
+                    total_cost, fixed_cost, variable_cost, salary_cost,
+                    hosting_cost, software_cost, admin_cost, conference_cost,
+                    compute_cost, customer_support_cost
+                )
+            ),
+            headcount_results
         )
+    
+    @staticmethod
+    def _per_simulation(cost: np.ndarray, shape: Tuple[int, int]) -> np.ndarray:
+        """
+        Store a cost component as a (num_simulations, months) VALUE_DTYPE array.
+        
+        Args:
+            cost: Cost per month, either shared by all simulations or per simulation
+            shape: Target (num_simulations, months) shape
+            
+        Returns:
+            Cost component with one row per simulation
+        """
+        return np.broadcast_to(cost, shape).astype(VALUE_DTYPE)
 
 
 class FinancialModel:
     """Complete financial model combining revenue and cost models."""
     
-    def __init__(self, revenue_params: RevenueParameters, cost_params: CostParameters):
+    def __init__(
+        self,
+        revenue_params: RevenueParameters,
+        cost_params: CostParameters,
+        seed: Optional[int] = None
+    ):
         """
         Initialize financial model.
         
         Args:
             revenue_params: Revenue model parameters
             cost_params: Cost model parameters
+            seed: Seed for the shared random generator (None for fresh entropy)
         """
-        self.revenue_model = RevenueModel(revenue_params)
-        self.cost_model = CostModel(cost_params)
+        rng = np.random.default_rng(seed)
+        self.revenue_model = RevenueModel(revenue_params, rng)
+        self.cost_model = CostModel(cost_params, rng)
     
-    def run_simulation(self, months: int, num_simulations: int) -> List[SimulationResults]:
+    def run_simulation(self, months: int, num_simulations: int) -> SimulationResults:
         """
         Run complete financial simulation.
         
@@ -288,41 +358,44 @@ class FinancialModel:
             num_simulations: Number of Monte Carlo simulations
             
         Returns:
-            List of simulation results
+            Simulation results for every path, stored as 2D arrays
         """
-        results = []
+        # Run revenue simulation for every path at once
+        (total_revenue, seat_revenue, simulation_revenue, 
+         customers, churn, simulation_years) = self.revenue_model.simulate_batch(months, num_simulations)
         
-        for _ in range(num_simulations):
-            # Run revenue simulation
-            (total_revenue, seat_revenue, simulation_revenue, 
-             customers, churn, simulation_years) = self.revenue_model.simulate_single_run(months)
-            
-            # Run cost simulation
-            (total_costs, fixed_costs, variable_costs, salary_costs,
-             hosting_costs, software_costs, admin_costs, conference_costs,
-             compute_costs, customer_support_costs, 
-             headcount) = self.cost_model.simulate_single_run(months, customers, simulation_years)
-            
-            # Create result object
-            result = SimulationResults(
-                total_revenue=total_revenue,
-                seat_revenue=seat_revenue,
-                simulation_revenue=simulation_revenue,
-                customers=customers,
-                churn=churn,
-                total_costs=total_costs,
-                fixed_costs=fixed_costs,
-                variable_costs=variable_costs,
-                salary_costs=salary_costs,
-                hosting_costs=hosting_costs,
-                software_costs=software_costs,
-                admin_costs=admin_costs,
-                conference_costs=conference_costs,
-                compute_costs=compute_costs,
-                customer_support_costs=customer_support_costs,
-                headcount=headcount
-            )
-            
-            results.append(result)
+        # Run cost simulation for every path at once
+        (total_costs, fixed_costs, variable_costs, salary_costs,
+         hosting_costs, software_costs, admin_costs, conference_costs,
+         compute_costs, customer_support_costs, 
+         headcount) = self.cost_model.simulate_batch(months, customers, simulation_years)
+        
+        # Earnings, with the per-simulation summaries reduced while the
+        # series are still hot rather than on every dashboard rerun
+        earnings = total_revenue - total_costs
+        # Accumulate in double precision; the monthly series are float32
+        cumulative_earnings = np.cumsum(earnings, axis=1, dtype=np.float64)
         
-        return results 
\ No newline at end of file
+        # Hand the batch arrays over as-is, one field per metric
+        return SimulationResults(
+            total_revenue=total_revenue,
+            seat_revenue=seat_revenue,
+            simulation_revenue=simulation_revenue,
+            customers=customers,
+            churn=churn,
+            total_costs=total_costs,
+            fixed_costs=fixed_costs,
+            variable_costs=variable_costs,
+            salary_costs=salary_costs,
+            hosting_costs=hosting_costs,
+            software_costs=software_costs,
+            admin_costs=admin_costs,
+            conference_costs=conference_costs,
+            compute_costs=compute_costs,
+            customer_support_costs=customer_support_costs,
+            headcount=headcount,
+            earnings=earnings,
+            cumulative_earnings=cumulative_earnings,
+            min_cumulative_earnings=cumulative_earnings.min(axis=1),
+            profitable_months=np.count_nonzero(earnings > 0, axis=1)
+        )
@@ -3,8 +3,143 @@ import streamlit as st
 import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
+from plotly.subplots import make_subplots
 import io
 
+# Seed for the cached simulations, so reruns reproduce the same draws. The
+# revenue and cost simulations draw from independent child streams of it.
+SEED = 42
+REVENUE_SEED, COST_SEED = np.random.SeedSequence(SEED).spawn(2)
+
+# Trace styles shared by the percentile charts
+MEDIAN_LINE = dict(color='blue', width=3)
+PERCENTILE_LINE = dict(color='red', width=2, dash='dot')
+
+QUANTILES = np.array([0.1, 0.5, 0.9])
+
+
+def get_quantiles(data):
+    # 10th percentile, median and 90th percentile per month, in one pass
+    p10, med, p90 = np.quantile(data, QUANTILES, axis=0)
+    return p10, med, p90
+
+
+@st.cache_data(show_spinner=False)
+def run_revenue_sim(months, simulations, seat_fee, avg_seats, sim_year_revenue_mean, sim_year_revenue_sigma,
+                    revenue_per_sim_year, customer_delay, customer_growth_median, customer_growth_sigma,
+                    customer_growth_accel, monthly_churn_median, monthly_churn_sigma, seed=REVENUE_SEED):
+    rng = np.random.default_rng(seed)
+
+    # Draw every month's growth and churn rates up front; only the churn
+    # recurrence has to step through the months, across all simulations at once
+    customer_growth_schedule = customer_growth_median * (1 + customer_growth_accel) ** np.arange(months)
+    new_customers = rng.lognormal(mean=np.log(customer_growth_schedule + 1e-9), sigma=customer_growth_sigma, size=(simulations, months)).astype(int)
+    new_customers[:, :customer_delay] = 0
+
+    churn_rates = rng.lognormal(mean=np.log(monthly_churn_median + 1e-9), sigma=monthly_churn_sigma, size=(simulations, months))
+    np.minimum(churn_rates, 0.5, out=churn_rates)
+
+    customer_results = np.empty((simulations, months), dtype=np.int32)
+    churn_results = np.empty((simulations, months), dtype=np.int32)
+    c = np.zeros(simulations, dtype=int)
+
+    for m in range(months):
+        c = c + new_customers[:, m]
+        churn_c = rng.binomial(c, churn_rates[:, m])
+        c = np.maximum(0, c - churn_c)
+
+        customer_results[:, m] = c
+        churn_results[:, m] = churn_c
+
+    # Each customer has random simulation usage: one lognormal draw per active
+    # customer-month, summed back into its (simulation, month) cell
+    counts = customer_results.ravel()
+    total_customers = int(counts.sum())
+    sim_years_results = np.zeros((simulations, months))
+    if total_customers > 0:
+        usage = rng.lognormal(mean=np.log(sim_year_revenue_mean + 1e-9), sigma=sim_year_revenue_sigma, size=total_customers)
+        # reduceat needs in-range starts; empty cells are zeroed afterwards
+        starts = np.minimum(np.cumsum(counts) - counts, total_customers - 1)
+        sim_years_results = np.where(counts > 0, np.add.reduceat(usage, starts), 0.0).reshape(simulations, months)
+
+    # Separate revenue streams
+    seat_revenue_results = np.multiply(customer_results, avg_seats * seat_fee, dtype=np.float64)
+    simulation_revenue_results = sim_years_results * revenue_per_sim_year
+    rev_results = seat_revenue_results + simulation_revenue_results
+
+    # Dollar amounts fit comfortably in float32 and counts in int32, which halves
+    # the bytes cached and sorted by the percentile calls
+    return (
+        rev_results.astype(np.float32),
+        seat_revenue_results.astype(np.float32),
+        simulation_revenue_results.astype(np.float32),
+        customer_results,
+        churn_results,
+    )
+
+
+@st.cache_data(show_spinner=False)
+def run_cost_sim(customers, months, simulations, hosting_initial, hosting_growth, software_initial, software_growth,
+                 admin_monthly, conference_monthly, salary_per_person, initial_headcount, headcount_delay,
+                 headcount_growth_median, headcount_growth_sigma, headcount_growth_accel, benefits_monthly,
+                 support_customer_initial, support_growth, compute_initial, compute_growth, seed=COST_SEED):
+    rng = np.random.default_rng(seed)
+
+    # Draw every month's hiring noise up front; only the headcount recurrence,
+    # whose slowdown depends on the running total, steps through the months
+    headcount_growth_schedule = headcount_growth_median * (1 + headcount_growth_accel) ** np.arange(months)
+    noise = np.exp(headcount_growth_sigma * rng.standard_normal((simulations, months)))
+    normal_adds = ((headcount_growth_schedule + 1e-9) * noise).astype(int)
+    # Slow down growth above 15 people: 50% reduction in growth rate for larger teams
+    slowed_adds = ((headcount_growth_schedule * 0.5 + 1e-9) * noise).astype(int)
+    normal_adds[:, :headcount_delay] = 0
+    slowed_adds[:, :headcount_delay] = 0
+
+    headcount_results = np.empty((simulations, months), dtype=np.int32)
+    headcount = np.full(simulations, initial_headcount)
+    for month in range(months):
+        headcount = headcount + np.where(headcount >= 15, slowed_adds[:, month], normal_adds[:, month])
+        headcount_results[:, month] = headcount
+
+    # Cost schedules depend only on the month, so they are computed once and
+    # broadcast across simulations
+    factor = np.arange(months) // 12
+    years = np.arange(months // 12 + 1)
+    shape = (simulations, months)
+
+    hosting_costs = np.broadcast_to(hosting_initial * ((1 + hosting_growth) ** years)[factor], shape)
+    software_costs = np.broadcast_to(software_initial * ((1 + software_growth) ** years)[factor], shape)
+    admin_costs = np.full(shape, admin_monthly)
+    conference_costs = np.full(shape, conference_monthly)
+    benefits_costs = np.full(shape, benefits_monthly)
+    salary_costs = np.multiply(headcount_results, salary_per_person, dtype=np.float64)
+
+    compute_costs = np.broadcast_to(compute_initial * ((1 + compute_growth) ** years)[factor], shape)
+    customer_costs = support_customer_initial * ((1 + support_growth) ** years)[factor] * customers
+
+    fixed_costs = hosting_costs + software_costs + admin_costs + conference_costs + benefits_costs + salary_costs
+    variable_costs = compute_costs + customer_costs
+    total_costs = fixed_costs + variable_costs
+
+    # Same storage types as the revenue simulation: float32 dollars, int32 counts
+    cost_results = {
+        'total': total_costs,
+        'fixed': fixed_costs,
+        'variable': variable_costs,
+        'customer': customer_costs,
+        'salary': salary_costs,
+        'hosting': hosting_costs,
+        'software': software_costs,
+        'admin': admin_costs,
+        'conference': conference_costs,
+        'benefits': benefits_costs,
+        'compute': compute_costs,
+    }
+    cost_results = {name: costs.astype(np.float32) for name, costs in cost_results.items()}
+    cost_results['headcount'] = headcount_results
+    return cost_results
+
+
 st.title('Distill Financials Dashboard')
 revenue_tab, costs_tab, earnings_tab = st.tabs(["Revenue", "Costs", "Earnings"])
 
@@ -39,67 +174,11 @@ with revenue_tab:
    monthly_churn_median = sidebar.slider('Median Monthly Churn Rate (%)', 0.0, 10.0, 5.0) / 100
    monthly_churn_sigma = 1.0
 
-   rev_results, customer_results, churn_results = [], [], []
-   # Separate revenue stream tracking
-   seat_revenue_results, simulation_revenue_results = [], []
-
-   for _ in range(simulations):
-       revenue, customers, churn_total = [], [], []
-       seat_revenue, simulation_revenue = [], []
-       c = 0
-       customer_growth = customer_growth_median
-
-       for m in range(months):
-           if m >= customer_delay:
-              new_customers = int(np.random.lognormal(mean=np.log(customer_growth + 1e-9), sigma=customer_growth_sigma))
-           else:
-              new_customers = 0
-          
-           c += new_customers
-
-           churn_rate = np.random.lognormal(mean=np.log(monthly_churn_median + 1e-9), sigma=monthly_churn_sigma)
-           churn_rate = min(churn_rate, 0.5)
-           churn_c = int(np.random.binomial(c, churn_rate))
-           c = max(0, c - churn_c)
-
-           customer_growth *= (1 + customer_growth_accel)
-
-           # Calculate individual revenue streams
-           monthly_seat_revenue = c * avg_seats * seat_fee
-           
-           # Calculate simulation-year revenue with random process
-           if c > 0:
-               # Each customer has random simulation usage
-               sim_years_total = 0
-               for _ in range(c):
-                   customer_sim_years = np.random.lognormal(
-                       mean=np.log(sim_year_revenue_mean + 1e-9), 
-                       sigma=sim_year_revenue_sigma
-                   )
-                   sim_years_total += customer_sim_years
-               
-               monthly_simulation_revenue = sim_years_total * revenue_per_sim_year
-           else:
-               monthly_simulation_revenue = 0
-
-           # Total revenue
-           month_rev = monthly_seat_revenue + monthly_simulation_revenue
-
-           revenue.append(month_rev)
-           seat_revenue.append(monthly_seat_revenue)
-           simulation_revenue.append(monthly_simulation_revenue)
-           customers.append(c)
-           churn_total.append(churn_c)
-
-       rev_results.append(revenue)
-       seat_revenue_results.append(seat_revenue)
-       simulation_revenue_results.append(simulation_revenue)
-       customer_results.append(customers)
-       churn_results.append(churn_total)
-
-   def get_quantiles(data):
-       df = pd.DataFrame(data)
-       return df.quantile(0.1), df.median(), df.quantile(0.9)
+   rev_results, seat_revenue_results, simulation_revenue_results, customer_results, churn_results = run_revenue_sim(
+       months, simulations, seat_fee, avg_seats, sim_year_revenue_mean, sim_year_revenue_sigma,
+       revenue_per_sim_year, customer_delay, customer_growth_median, customer_growth_sigma,
+       customer_growth_accel, monthly_churn_median, monthly_churn_sigma
+   )
 
    rev_p10, rev_med, rev_p90 = get_quantiles(rev_results)
    seat_p10, seat_med, seat_p90 = get_quantiles(seat_revenue_results)
@@ -109,7 +188,7 @@ with revenue_tab:
 
    def plot_metric(p10, median, p90, title, yaxis):
       fig = go.Figure()
-      fig.add_trace(go.Scatter(y=median, mode='lines', name='Median', line=dict(color='blue', width=3)))
+      fig.add_trace(go.Scatter(y=median, mode='lines', name='Median', line=MEDIAN_LINE))
       fig.add_trace(go.Scatter(y=p10, mode='lines', name='10th Percentile', line=dict(color='red', width=3)))
       fig.add_trace(go.Scatter(y=p90, mode='lines', name='90th Percentile', line=dict(color='red', width=3, dash='dash')))
       fig.update_layout(title=title, xaxis_title='Month', yaxis_title=yaxis)
@@ -136,17 +215,20 @@ with revenue_tab:
        'Median Revenue': rev_med,
        '10th Percentile Revenue': rev_p10,
        '90th Percentile Revenue': rev_p90,
-       'Median Customers': customer_med.astype(int),
-       'Median Churn': churn_med.astype(int)
+       'Median Customers': customer_med.astype(np.int32),
+       'Median Churn': churn_med.astype(np.int32)
    })
    
-   output = io.BytesIO()
-   with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
-       export_df.to_excel(writer, sheet_name='Projections', index=False)
+   # Build the workbook only when the download is clicked, not on every rerun
+   def build_workbook():
+       output = io.BytesIO()
+       with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
+           export_df.to_excel(writer, sheet_name='Projections', index=False)
+       return output.getvalue()
    
    st.download_button(
        label="Export All Projections to Excel",
-       data=output.getvalue(),
+       data=build_workbook,
        file_name="detailed_revenue_projections.xlsx",
        mime="application/vnd.ms-excel"
    )
@@ -183,133 +265,70 @@ with costs_tab:
     compute_growth = costs_sidebar.slider('Compute Growth Rate (%)', 0, 100, 100) / 100
 
 
-    total_costs, fixed_costs, variable_costs, customer_costs, salary_costs, headcount_results = [], [], [], [], [], []
-    # Individual cost component tracking
-    hosting_costs, software_costs, admin_costs, conference_costs, benefits_costs = [], [], [], [], []
-    compute_costs = []
-
-    customers = np.array(shared_data['customers'])
-
-    for sim in range(simulations):
-        sim_total, sim_fixed, sim_variable, sim_customer, sim_salary, sim_headcount = [], [], [], [], [], []
-        # Individual cost tracking
-        sim_hosting, sim_software, sim_admin, sim_conference, sim_benefits = [], [], [], [], []
-        sim_compute = []
-        
-        headcount = initial_headcount
-        headcount_growth = headcount_growth_median
-
-        for month in range(months):
-            # Headcount growth simulation
-            if month >= headcount_delay:
-                # Slow down growth above 15 people
-                if headcount >= 15:
-                    # Apply 50% reduction in growth rate for larger teams
-                    adjusted_growth = headcount_growth * 0.5
-                else:
-                    adjusted_growth = headcount_growth
-                
-                new_headcount = int(np.random.lognormal(mean=np.log(adjusted_growth + 1e-9), sigma=headcount_growth_sigma))
-            else:
-                new_headcount = 0
-            
-            headcount += new_headcount
-            headcount_growth *= (1 + headcount_growth_accel)
-
-            factor = month // 12
-
-            # Individual cost calculations
-            hosting_cost = hosting_initial*(1+hosting_growth)**factor
-            software_cost = software_initial*(1+software_growth)**factor
-            admin_cost = admin_monthly
-            conference_cost = conference_monthly
-            salary = headcount * salary_per_person
-            benefits_cost = benefits_monthly
-            
-            fixed = hosting_cost + software_cost + admin_cost + conference_cost + benefits_cost + salary
-            
-            compute_cost = compute_initial * (1 + compute_growth)**factor
-            customer_cost = support_customer_initial*(1+support_growth)**factor * customers[sim, month]
-
-            variable = compute_cost  + customer_cost
-            total = fixed + variable
-
-            # Store individual components
-            sim_total.append(total)
-            sim_fixed.append(fixed)
-            sim_variable.append(variable)
-            sim_customer.append(customer_cost)
-            sim_salary.append(salary)
-            sim_headcount.append(headcount)
-            
-            # Individual cost components
-            sim_hosting.append(hosting_cost)
-            sim_software.append(software_cost)
-            sim_admin.append(admin_cost)
-            sim_conference.append(conference_cost)
-            sim_benefits.append(benefits_cost)
-            sim_compute.append(compute_cost)
-
-        total_costs.append(sim_total)
-        fixed_costs.append(sim_fixed)
-        variable_costs.append(sim_variable)
-        customer_costs.append(sim_customer)
-        salary_costs.append(sim_salary)
-        headcount_results.append(sim_headcount)
-        
-        # Individual cost results
-        hosting_costs.append(sim_hosting)
-        software_costs.append(sim_software)
-        admin_costs.append(sim_admin)
-        conference_costs.append(sim_conference)
-        benefits_costs.append(sim_benefits)
-        compute_costs.append(sim_compute)
+    cost_results = run_cost_sim(
+        shared_data['customers'], months, simulations, hosting_initial, hosting_growth, software_initial, software_growth,
+        admin_monthly, conference_monthly, salary_per_person, initial_headcount, headcount_delay,
+        headcount_growth_median, headcount_growth_sigma, headcount_growth_accel, benefits_monthly,
+        support_customer_initial, support_growth, compute_initial, compute_growth
+    )
+    total_costs, fixed_costs, variable_costs = cost_results['total'], cost_results['fixed'], cost_results['variable']
+    customer_costs, salary_costs, headcount_results = cost_results['customer'], cost_results['salary'], cost_results['headcount']
+    hosting_costs, software_costs, admin_costs = cost_results['hosting'], cost_results['software'], cost_results['admin']
+    conference_costs, benefits_costs, compute_costs = cost_results['conference'], cost_results['benefits'], cost_results['compute']
 
     # Store headcount data for other tabs
     shared_data['headcount'] = headcount_results
 
-    def plot_costs(data, title):
-        p10, med, p90 = np.percentile(data, [10, 50, 90], axis=0)
-        fig = go.Figure()
-        fig.add_trace(go.Scatter(y=med, name='Median', line=dict(color='blue', width=3)))
-        fig.add_trace(go.Scatter(y=p10, name='10th Percentile', line=dict(color='red', width=2, dash='dot')))
-        fig.add_trace(go.Scatter(y=p90, name='90th Percentile', line=dict(color='red', width=2, dash='dot')))
-        fig.update_layout(title=title, xaxis_title='Month', yaxis_title='Cost ($)')
+    def plot_costs(series, title):
+        # One figure with a row per cost series, so a section is a single chart element
+        fig = make_subplots(rows=len(series), cols=1, shared_xaxes=True, subplot_titles=list(series), vertical_spacing=0.04)
+        for row, data in enumerate(series.values(), start=1):
+            p10, med, p90 = get_quantiles(data)
+            fig.add_trace(go.Scatter(y=med, name='Median', legendgroup='median', showlegend=row == 1, line=MEDIAN_LINE), row=row, col=1)
+            fig.add_trace(go.Scatter(y=p10, name='10th Percentile', legendgroup='p10', showlegend=row == 1, line=PERCENTILE_LINE), row=row, col=1)
+            fig.add_trace(go.Scatter(y=p90, name='90th Percentile', legendgroup='p90', showlegend=row == 1, line=PERCENTILE_LINE), row=row, col=1)
+            fig.update_yaxes(title_text='Cost ($)', row=row, col=1)
+        fig.update_xaxes(title_text='Month', row=len(series), col=1)
+        fig.update_layout(title=title, height=300 * len(series))
         st.plotly_chart(fig)
 
     def plot_headcount(data, title):
-        p10, med, p90 = np.percentile(data, [10, 50, 90], axis=0)
+        p10, med, p90 = get_quantiles(data)
         fig = go.Figure()
-        fig.add_trace(go.Scatter(y=med, name='Median', line=dict(color='blue', width=3)))
-        fig.add_trace(go.Scatter(y=p10, name='10th Percentile', line=dict(color='red', width=2, dash='dot')))
-        fig.add_trace(go.Scatter(y=p90, name='90th Percentile', line=dict(color='red', width=2, dash='dot')))
+        fig.add_trace(go.Scatter(y=med, name='Median', line=MEDIAN_LINE))
+        fig.add_trace(go.Scatter(y=p10, name='10th Percentile', line=PERCENTILE_LINE))
+        fig.add_trace(go.Scatter(y=p90, name='90th Percentile', line=PERCENTILE_LINE))
         fig.update_layout(title=title, xaxis_title='Month', yaxis_title='Headcount')
         st.plotly_chart(fig)
 
     # Aggregate cost charts
     st.subheader("Aggregate Cost Views")
-    plot_costs(total_costs, 'Total Monthly Costs')
-    plot_costs(fixed_costs, 'Fixed Monthly Costs')
-    plot_costs(variable_costs, 'Variable Monthly Costs')
+    plot_costs({
+        'Total Monthly Costs': total_costs,
+        'Fixed Monthly Costs': fixed_costs,
+        'Variable Monthly Costs': variable_costs,
+    }, 'Aggregate Monthly Costs')
     
     # Individual cost component charts
     st.subheader("Individual Cost Components")
-    plot_costs(salary_costs, 'Salary Costs')
-    plot_costs(hosting_costs, 'Hosting Costs')
-    plot_costs(software_costs, 'Software Subscription Costs')
-    plot_costs(compute_costs, 'Compute Costs')
-    plot_costs(customer_costs, 'Customer Support Costs')
-    plot_costs(admin_costs, 'Admin & Legal Costs')
-    plot_costs(conference_costs, 'Conference Costs')
-    plot_costs(benefits_costs, 'Benefits Costs')
+    plot_costs({
+        'Salary Costs': salary_costs,
+        'Hosting Costs': hosting_costs,
+        'Software Subscription Costs': software_costs,
+        'Compute Costs': compute_costs,
+        'Customer Support Costs': customer_costs,
+        'Admin & Legal Costs': admin_costs,
+        'Conference Costs': conference_costs,
+        'Benefits Costs': benefits_costs,
+    }, 'Cost Components')
     
     # Headcount chart
     st.subheader("Team Growth")
     plot_headcount(headcount_results, 'Headcount Growth')
 
     # Summary metrics for costs
-    final_month_costs = np.array([sim[-1] for sim in total_costs])
-    final_month_headcount = np.array([sim[-1] for sim in headcount_results])
+    final_month_costs = total_costs[:, -1]
+    final_month_headcount = headcount_results[:, -1]
     
     col1, col2, col3 = st.columns(3)
     with col1:
@@ -323,35 +342,36 @@ with costs_tab:
 with earnings_tab:
     st.header('Earnings Dashboard')
 
-    revenue_simulations = np.array(shared_data['monthly_revenue'])
-    seat_revenue_simulations = np.array(shared_data['seat_revenue'])
-    simulation_revenue_simulations = np.array(shared_data['simulation_revenue'])
-    cost_simulations = np.array(total_costs)
-    headcount_simulations = np.array(shared_data['headcount'])
+    revenue_simulations = shared_data['monthly_revenue']
+    seat_revenue_simulations = shared_data['seat_revenue']
+    simulation_revenue_simulations = shared_data['simulation_revenue']
+    cost_simulations = total_costs
+    headcount_simulations = shared_data['headcount']
 
     earnings_simulations = revenue_simulations - cost_simulations
-    cumulative_earnings = np.cumsum(earnings_simulations, axis=1)
+    # Accumulate in float64 so the running total doesn't lose float32 precision
+    cumulative_earnings = np.cumsum(earnings_simulations, axis=1, dtype=np.float64)
 
     def plot_earnings(data, title):
-        p10, med, p90 = np.percentile(data, [10, 50, 90], axis=0)
+        p10, med, p90 = get_quantiles(data)
         fig = go.Figure()
-        fig.add_trace(go.Scatter(y=med, name='Median', line=dict(color='blue', width=3)))
-        fig.add_trace(go.Scatter(y=p10, name='10th Percentile', line=dict(color='red', width=2, dash='dot')))
-        fig.add_trace(go.Scatter(y=p90, name='90th Percentile', line=dict(color='red', width=2, dash='dot')))
+        fig.add_trace(go.Scatter(y=med, name='Median', line=MEDIAN_LINE))
+        fig.add_trace(go.Scatter(y=p10, name='10th Percentile', line=PERCENTILE_LINE))
+        fig.add_trace(go.Scatter(y=p90, name='90th Percentile', line=PERCENTILE_LINE))
         fig.update_layout(title=title, xaxis_title='Month', yaxis_title='Earnings ($)')
         st.plotly_chart(fig)
 
     def plot_revenue_costs(data, title, color='blue'):
-        p10, med, p90 = np.percentile(data, [10, 50, 90], axis=0)
+        p10, med, p90 = get_quantiles(data)
         fig = go.Figure()
         fig.add_trace(go.Scatter(y=med, name='Median', line=dict(color=color, width=3)))
-        fig.add_trace(go.Scatter(y=p10, name='10th Percentile', line=dict(color='red', width=2, dash='dot')))
-        fig.add_trace(go.Scatter(y=p90, name='90th Percentile', line=dict(color='red', width=2, dash='dot')))
+        fig.add_trace(go.Scatter(y=p10, name='10th Percentile', line=PERCENTILE_LINE))
+        fig.add_trace(go.Scatter(y=p90, name='90th Percentile', line=PERCENTILE_LINE))
         fig.update_layout(title=title, xaxis_title='Month', yaxis_title='Amount ($)')
         st.plotly_chart(fig)
 
     def plot_headcount_earnings(data, title):
-        p10, med, p90 = np.percentile(data, [10, 50, 90], axis=0)
+        p10, med, p90 = get_quantiles(data)
         fig = go.Figure()
         fig.add_trace(go.Scatter(y=med, name='Median', line=dict(color='green', width=3)))
         fig.add_trace(go.Scatter(y=p10, name='10th Percentile', line=dict(color='orange', width=2, dash='dot')))
@@ -381,19 +401,25 @@ with earnings_tab:
     plot_headcount_earnings(headcount_simulations, 'Headcount Evolution')
 
     # Calculate per-employee metrics
-    revenue_per_employee = revenue_simulations / np.maximum(headcount_simulations, 1)  # Avoid division by zero
-    earnings_per_employee = earnings_simulations / np.maximum(headcount_simulations, 1)
+    def per_employee(values, headcount):
+        # Divide into a copy of the values; an empty team counts as one person
+        return np.divide(values, headcount, out=np.array(values, dtype=float), where=headcount > 0)
+
+    revenue_per_employee = per_employee(revenue_simulations, headcount_simulations)
+    earnings_per_employee = per_employee(earnings_simulations, headcount_simulations)
 
     plot_earnings(revenue_per_employee, 'Revenue per Employee')
     plot_earnings(earnings_per_employee, 'Earnings per Employee')
 
-    break_even_months = [np.argmax(cum > 0) if np.any(cum > 0) else months for cum in cumulative_earnings]
+    # First profitable month per simulation, or months if it never breaks even
+    profitable = cumulative_earnings > 0
+    break_even_months = np.where(profitable.any(axis=1), profitable.argmax(axis=1), months)
     median_break_even = np.median(break_even_months)
 
     # Enhanced metrics
-    final_earnings = np.array([sim[-1] for sim in cumulative_earnings])
-    final_headcount = np.array([sim[-1] for sim in headcount_simulations])
-    final_revenue = np.array([sim[-1] for sim in revenue_simulations])
+    final_earnings = cumulative_earnings[:, -1]
+    final_headcount = headcount_simulations[:, -1]
+    final_revenue = revenue_simulations[:, -1]
 
     st.subheader("Key Metrics")
     col1, col2, col3 = st.columns(3)
@@ -406,10 +432,10 @@ with earnings_tab:
 
     col4, col5, col6 = st.columns(3)
     with col4:
-        st.metric("Final Revenue per Employee", f"${np.median(final_revenue/np.maximum(final_headcount, 1)):,.0f}")
+        st.metric("Final Revenue per Employee", f"${np.median(per_employee(final_revenue, final_headcount)):,.0f}")
     with col5:
-        final_monthly_earnings = np.array([sim[-1] for sim in earnings_simulations])
+        final_monthly_earnings = earnings_simulations[:, -1]
         st.metric("Final Monthly Earnings", f"${np.median(final_monthly_earnings):,.0f}")
     with col6:
-        st.metric("Final Earnings per Employee", f"${np.median(final_monthly_earnings/np.maximum(final_headcount, 1)):,.0f}")
+        st.metric("Final Earnings per Employee", f"${np.median(per_employee(final_monthly_earnings, final_headcount)):,.0f}")
 
@@ -0,0 +1,50 @@
+"""
+Checks that the legacy script's revenue and cost simulations draw from
+independent random streams.
+
+Run with: python -m unittest discover tests
+"""
+
+import importlib.util
+import inspect
+import unittest
+from pathlib import Path
+
+SCRIPT = Path(__file__).resolve().parent.parent / "streamlit_revenue_simulation_backup.py"
+
+
+def load_legacy_script():
+    """Import the legacy dashboard script (renders once in Streamlit bare mode)."""
+    spec = importlib.util.spec_from_file_location("legacy_dashboard", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def default_seed(cached_function):
+    """Return the default seed of a st.cache_data-wrapped simulation."""
+    return inspect.signature(cached_function.__wrapped__).parameters["seed"].default
+
+
+class LegacyStreamIndependenceTest(unittest.TestCase):
+    """The hiring noise must not replay the customer-acquisition noise."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.legacy = load_legacy_script()
+
+    def test_revenue_sim_defaults_to_revenue_seed(self):
+        self.assertIs(default_seed(self.legacy.run_revenue_sim), self.legacy.REVENUE_SEED)
+
+    def test_cost_sim_defaults_to_cost_seed(self):
+        self.assertIs(default_seed(self.legacy.run_cost_sim), self.legacy.COST_SEED)
+
+    def test_default_seeds_are_distinct_streams(self):
+        revenue_seed = default_seed(self.legacy.run_revenue_sim)
+        cost_seed = default_seed(self.legacy.run_cost_sim)
+        self.assertIsNot(revenue_seed, cost_seed)
+        self.assertNotEqual(revenue_seed.spawn_key, cost_seed.spawn_key)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -7,30 +7,29 @@ sidebars, and organizing the user interface.
 
 import streamlit as st
 import io
-import pandas as pd
-from typing import Tuple
+from typing import List, Tuple
 
 from config import REVENUE_CONFIG, COST_CONFIG, SIMULATION_CONFIG
-from models import RevenueParameters, CostParameters
+from models import RevenueParameters, CostParameters, SimulationResults
 
 
 def create_simulation_controls() -> Tuple[int, int]:
     """
-    Create main simulation control inputs.
+    Create main simulation control inputs in the active container.
     
     Returns:
         Tuple of (months, simulations)
     """
-    st.sidebar.header("Simulation Parameters")
+    st.header("Simulation Parameters")
     
-    months = st.sidebar.number_input(
+    months = st.number_input(
         'Projection Period (Months)', 
         min_value=SIMULATION_CONFIG.months_min, 
         max_value=SIMULATION_CONFIG.months_max, 
         value=SIMULATION_CONFIG.months_default
     )
     
-    simulations = st.sidebar.number_input(
+    simulations = st.number_input(
         'Number of Simulations', 
         min_value=SIMULATION_CONFIG.simulations_min, 
         max_value=SIMULATION_CONFIG.simulations_max, 
@@ -42,7 +41,7 @@ def create_simulation_controls() -> Tuple[int, int]:
 
 def create_revenue_controls(months: int) -> RevenueParameters:
     """
-    Create revenue model input controls.
+    Create revenue model input controls in the active container.
     
     Args:
         months: Maximum months for delay validation
@@ -50,15 +49,15 @@ def create_revenue_controls(months: int) -> RevenueParameters:
     Returns:
         RevenueParameters object with user inputs
     """
-    st.sidebar.header("Revenue Assumptions")
+    st.header("Revenue Assumptions")
     
     # Seat-based revenue controls
-    seat_fee = st.sidebar.number_input(
+    seat_fee = st.number_input(
         'Monthly Fee per Seat ($)', 
         value=REVENUE_CONFIG.seat_fee_default
     )
     
-    avg_seats = st.sidebar.slider(
+    avg_seats = st.slider(
         'Average Seats per Customer', 
         REVENUE_CONFIG.avg_seats_min, 
         REVENUE_CONFIG.avg_seats_max, 
@@ -66,45 +65,45 @@ def create_revenue_controls(months: int) -> RevenueParameters:
     )
     
     # Simulation-year revenue controls
-    st.sidebar.subheader("Simulation Usage Revenue")
+    st.subheader("Simulation Usage Revenue")
     
-    sim_year_revenue_mean = st.sidebar.number_input(
+    sim_year_revenue_mean = st.number_input(
         'Mean Simulation-Years per Customer per Month',
         min_value=REVENUE_CONFIG.sim_year_revenue_mean_min,
         max_value=REVENUE_CONFIG.sim_year_revenue_mean_max,
         value=REVENUE_CONFIG.sim_year_revenue_mean_default
     )
     
-    sim_year_revenue_sigma = st.sidebar.slider(
+    sim_year_revenue_sigma = st.slider(
         'Simulation-Year Usage Volatility',
         REVENUE_CONFIG.sim_year_revenue_sigma_min,
         REVENUE_CONFIG.sim_year_revenue_sigma_max,
         REVENUE_CONFIG.sim_year_revenue_sigma_default
     )
     
-    revenue_per_sim_year = st.sidebar.number_input(
+    revenue_per_sim_year = st.number_input(
         'Revenue per Simulation-Year ($)',
         value=REVENUE_CONFIG.revenue_per_sim_year_default
     )
     
     # Customer growth controls
-    st.sidebar.subheader("Customer Growth")
+    st.subheader("Customer Growth")
     
-    customer_delay = st.sidebar.number_input(
+    customer_delay = st.number_input(
         'Months Delay for Customer Acquisition',
         min_value=0,
         max_value=months,
         value=REVENUE_CONFIG.customer_delay_default
     )
     
-    customer_growth_median = st.sidebar.slider(
+    customer_growth_median = st.slider(
         'Median Customer Adds',
         REVENUE_CONFIG.customer_growth_median_min,
         REVENUE_CONFIG.customer_growth_median_max,
         REVENUE_CONFIG.customer_growth_median_default
     )
     
-    customer_growth_accel = st.sidebar.slider(
+    customer_growth_accel = st.slider(
         'Monthly Customer Growth Acceleration (%)',
         REVENUE_CONFIG.customer_growth_accel_min,
         REVENUE_CONFIG.customer_growth_accel_max,
@@ -113,9 +112,9 @@ def create_revenue_controls(months: int) -> RevenueParameters:
     ) / 100
     
     # Churn controls
-    st.sidebar.subheader("Customer Churn")
+    st.subheader("Customer Churn")
     
-    monthly_churn_median = st.sidebar.slider(
+    monthly_churn_median = st.slider(
         'Median Monthly Churn Rate (%)',
         REVENUE_CONFIG.monthly_churn_median_min,
         REVENUE_CONFIG.monthly_churn_median_max,
@@ -139,7 +138,7 @@ def create_revenue_controls(months: int) -> RevenueParameters:
 
 def create_cost_controls(months: int) -> CostParameters:
     """
-    Create cost model input controls.
+    Create cost model input controls in the active container.
     
     Args:
         months: Maximum months for delay validation
@@ -147,29 +146,29 @@ def create_cost_controls(months: int) -> CostParameters:
     Returns:
         CostParameters object with user inputs
     """
-    st.sidebar.header("Cost Assumptions")
+    st.header("Cost Assumptions")
     
     # Infrastructure costs
-    st.sidebar.subheader("Infrastructure Costs")
+    st.subheader("Infrastructure Costs")
     
-    hosting_initial = st.sidebar.number_input(
+    hosting_initial = st.number_input(
         'Hosting Initial Monthly ($)',
         value=COST_CONFIG.hosting_initial_default
     )
     
-    hosting_growth = st.sidebar.slider(
+    hosting_growth = st.slider(
         'Hosting Growth Rate (%)',
         COST_CONFIG.hosting_growth_min,
         COST_CONFIG.hosting_growth_max,
         COST_CONFIG.hosting_growth_default
     ) / 100
     
-    software_initial = st.sidebar.number_input(
+    software_initial = st.number_input(
         'Software Subscriptions Initial Monthly ($)',
         value=COST_CONFIG.software_initial_default
     )
     
-    software_growth = st.sidebar.slider(
+    software_growth = st.slider(
         'Software Growth Rate (%)',
         COST_CONFIG.software_growth_min,
         COST_CONFIG.software_growth_max,
@@ -177,48 +176,48 @@ def create_cost_controls(months: int) -> CostParameters:
     ) / 100
     
     # Fixed costs
-    st.sidebar.subheader("Fixed Costs")
+    st.subheader("Fixed Costs")
     
-    admin_monthly = st.sidebar.number_input(
+    admin_monthly = st.number_input(
         'Admin & Legal Monthly ($)',
         value=COST_CONFIG.admin_monthly_default
     )
     
-    conference_monthly = st.sidebar.number_input(
+    conference_monthly = st.number_input(
         'Conference Fees Monthly ($)',
         value=COST_CONFIG.conference_monthly_default
     )
     
     # Headcount-based salary parameters
-    st.sidebar.subheader("Headcount & Salaries")
+    st.subheader("Headcount & Salaries")
     
-    salary_per_person = st.sidebar.number_input(
+    salary_per_person = st.number_input(
         'Average monthly fully loaded cost per person ($)',
         value=COST_CONFIG.salary_per_person_default
     )
     
-    initial_headcount = st.sidebar.number_input(
+    initial_headcount = st.number_input(
         'Initial Headcount',
         min_value=COST_CONFIG.initial_headcount_min,
         max_value=COST_CONFIG.initial_headcount_max,
         value=COST_CONFIG.initial_headcount_default
     )
     
-    headcount_delay = st.sidebar.number_input(
+    headcount_delay = st.number_input(
         'Months Delay for Headcount Growth',
         min_value=0,
         max_value=months,
         value=COST_CONFIG.headcount_delay_default
     )
     
-    headcount_growth_median = st.sidebar.slider(
+    headcount_growth_median = st.slider(
         'Median Headcount Adds',
         COST_CONFIG.headcount_growth_median_min,
         COST_CONFIG.headcount_growth_median_max,
         COST_CONFIG.headcount_growth_median_default
     )
     
-    headcount_growth_accel = st.sidebar.slider(
+    headcount_growth_accel = st.slider(
         'Monthly Headcount Growth Acceleration (%)',
         COST_CONFIG.headcount_growth_accel_min,
         COST_CONFIG.headcount_growth_accel_max,
@@ -227,33 +226,33 @@ def create_cost_controls(months: int) -> CostParameters:
     ) / 100
     
     # Variable costs
-    st.sidebar.subheader("Variable Costs")
+    st.subheader("Variable Costs")
     
-    support_customer_initial = st.sidebar.number_input(
+    support_customer_initial = st.number_input(
         'Support Cost per Customer Monthly ($)',
         value=COST_CONFIG.support_customer_initial_default
     )
     
-    support_growth = st.sidebar.slider(
+    support_growth = st.slider(
         'Support Growth Rate (%)',
         COST_CONFIG.support_growth_min,
         COST_CONFIG.support_growth_max,
         COST_CONFIG.support_growth_default
     ) / 100
     
-    compute_initial = st.sidebar.number_input(
+    compute_initial = st.number_input(
         'Compute Initial Monthly ($)',
         value=COST_CONFIG.compute_initial_default
     )
     
-    compute_growth = st.sidebar.slider(
+    compute_growth = st.slider(
         'Compute Growth Rate (%)',
         COST_CONFIG.compute_growth_min,
         COST_CONFIG.compute_growth_max,
         COST_CONFIG.compute_growth_default
     ) / 100
     
-    compute_per_sim_year = st.sidebar.slider(
+    compute_per_sim_year = st.slider(
         'Compute Cost per Simulation-Year ($)',
         COST_CONFIG.compute_per_sim_year_min,
         COST_CONFIG.compute_per_sim_year_max,
@@ -283,31 +282,76 @@ def create_cost_controls(months: int) -> CostParameters:
     )
 
 
-def create_export_button(results: list, months: int) -> None:
+def create_parameter_form() -> Tuple[int, int, RevenueParameters, CostParameters]:
+    """
+    Create all sidebar controls inside a single form.
+    
+    Widget edits are batched until the form is submitted, so adjusting
+    several sliders triggers one rerun (and one simulation) instead of one
+    per change.
+    
+    Returns:
+        Tuple of (months, simulations, revenue parameters, cost parameters)
+    """
+    with st.sidebar.form("simulation_parameters"):
+        months, simulations = create_simulation_controls()
+        revenue_params = create_revenue_controls(months)
+        cost_params = create_cost_controls(months)
+        st.form_submit_button("Run Simulation")
+    
+    # The delay inputs are bounded by the months value from the previous
+    # submit, so clamp them to the horizon submitted alongside them
+    revenue_params = revenue_params._replace(customer_delay=min(revenue_params.customer_delay, months))
+    cost_params = cost_params._replace(headcount_delay=min(cost_params.headcount_delay, months))
+    
+    return months, simulations, revenue_params, cost_params
+
+
+@st.fragment
+def create_export_button(results: SimulationResults, months: int) -> None:
     """
     Create Excel export functionality.
     
+    Runs as a fragment, so clicking the download button reruns only this
+    section instead of the whole dashboard. The workbook is built only when
+    the button is clicked, not on every rerun.
+    
     Args:
         results: Simulation results
         months: Number of months simulated
     """
-    from visualization import create_export_dataframe
-    
-    export_df = create_export_dataframe(results, months)
-    
-    # Create Excel file
-    output = io.BytesIO()
-    with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
-        export_df.to_excel(writer, sheet_name='Projections', index=False)
+    def build_workbook() -> bytes:
+        # Imported on first use so pandas loads only when an export is requested
+        import pandas as pd
+        from visualization import create_export_dataframe
+        
+        export_df = create_export_dataframe(results, months)
+        
+        output = io.BytesIO()
+        with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
+            export_df.to_excel(writer, sheet_name='Projections', index=False)
+        return output.getvalue()
     
     st.download_button(
         label="Export All Projections to Excel",
-        data=output.getvalue(),
+        data=build_workbook,
         file_name="detailed_revenue_projections.xlsx",
         mime="application/vnd.ms-excel"
     )
 
 
+def display_metric_row(specs: List[Tuple[str, str, float]]) -> None:
+    """
+    Display a row of metrics, one column per spec.
+    
+    Args:
+        specs: List of (label, format string, value) tuples
+    """
+    columns = st.columns(len(specs))
+    for column, (label, fmt, value) in zip(columns, specs):
+        column.metric(label, fmt.format(value))
+
+
 def display_app_header() -> None:
     """Display the main application header and description. Tufte-inspired: minimal, informative."""
     st.title('Distill Financial Model')